@@ -1,10 +1,69 @@
-from typing import Dict, Union, Optional, Generator
+from typing import (
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+import asyncio
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 import requests
 from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.connection import HTTPSConnection
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
 from urllib3.util.retry import Retry
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta, timezone, tzinfo
+import functools
+import itertools
+import json
+import math
+import socket
+import threading
 import time
+import os
+from urllib.parse import urlencode
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib json module
+    orjson = None
+
+try:
+    import httpx
+except ImportError:  # httpx is optional, only needed for http2=True
+    httpx = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pyarrow is optional, only needed for arrow=True
+    pa = None
+
+_FETCH_ERRORS = (requests.exceptions.RequestException, urllib3.exceptions.HTTPError)
+if httpx is not None:
+    _FETCH_ERRORS += (httpx.HTTPError,)
+
+# Columns that hold numbers formatted as text, e.g. "$1,234" or "($0.12)".
+_EARNINGS_NUMERIC_COLUMNS = (
+    "marketCap",
+    "epsForecast",
+    "lastYearEPS",
+    "eps",
+    "noOfEsts",
+)
+_DIVIDENDS_NUMERIC_COLUMNS = ("dividend_Rate", "indicated_Annual_Dividend")
+
+# How long an address resolved at startup is used before falling back to
+# normal DNS resolution, so a stale CDN edge is not pinned for long.
+_WARM_DNS_TTL = 60.0
 
 
 class EventCalendarError(Exception):
@@ -13,6 +72,168 @@ class EventCalendarError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_date(value: str) -> pd.Timestamp:
+    """Parse a date string, trying the YYYY-MM-DD fast path first.
+
+    Args:
+        value (str): Date string from a request or response.
+
+    Returns:
+        pd.Timestamp: Parsed date.
+    """
+    try:
+        return pd.Timestamp(datetime.strptime(value, "%Y-%m-%d"))
+    except ValueError:
+        return pd.to_datetime(value)
+
+
+def _business_days(start_date: str, end_date: str) -> List[str]:
+    """List the business days between two dates, inclusive.
+
+    Args:
+        start_date (str): First date in YYYY-MM-DD format.
+        end_date (str): Last date in YYYY-MM-DD format.
+
+    Returns:
+        List[str]: Weekdays in the range in YYYY-MM-DD format.
+    """
+    return pd.bdate_range(start_date, end_date).strftime("%Y-%m-%d").tolist()
+
+
+def _months(start_date: str, end_date: str) -> List[str]:
+    """List the months between two months, inclusive.
+
+    Args:
+        start_date (str): First month in YYYY-MM format.
+        end_date (str): Last month in YYYY-MM format.
+
+    Returns:
+        List[str]: Months in the range in YYYY-MM format.
+    """
+    start = datetime.strptime(start_date, "%Y-%m")
+    end = datetime.strptime(end_date, "%Y-%m")
+    return pd.date_range(start=start, end=end, freq="MS").strftime("%Y-%m").tolist()
+
+
+@functools.lru_cache(maxsize=1)
+def _market_tz() -> tzinfo:
+    """Get the US Eastern time zone Nasdaq publishes calendars in.
+
+    Falls back to a fixed UTC-5 offset when no time zone database is
+    available, so a missing database never breaks the import or a fetch.
+
+    Returns:
+        tzinfo: America/New_York, or UTC-5 if it cannot be loaded.
+    """
+    try:
+        return ZoneInfo("America/New_York")
+    except ZoneInfoNotFoundError:
+        return timezone(timedelta(hours=-5))
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter."""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """Initialize the bucket full.
+
+        Args:
+            rate (float): Tokens added per second.
+            capacity (float, optional): Maximum number of stored tokens. Defaults to 1.0.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                self._cond.wait((1 - self._tokens) / self.rate)
+
+
+class _WarmResolver:
+    """Addresses of a host resolved in the background ahead of first use."""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._resolved: Optional[Tuple[List[str], float]] = None
+
+    def resolve(self) -> None:
+        """Resolve the host, keeping every address in resolver order."""
+        try:
+            infos = socket.getaddrinfo(self.host, self.port, type=socket.SOCK_STREAM)
+        except OSError:
+            return
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        self._resolved = (addresses, time.monotonic())
+
+    def addresses(self) -> List[str]:
+        """Get the resolved addresses.
+
+        Returns:
+            List[str]: Addresses, or an empty list if resolution has not finished, failed, was forgotten, or is older than the warm-up TTL.
+        """
+        resolved = self._resolved
+        if resolved is None or time.monotonic() - resolved[1] > _WARM_DNS_TTL:
+            return []
+        return resolved[0]
+
+    def forget(self) -> None:
+        """Stop handing out the resolved addresses."""
+        self._resolved = None
+
+
+class _WarmHTTPSConnection(HTTPSConnection):
+    """HTTPS connection that dials addresses resolved ahead of time.
+
+    Only the TCP connect uses the resolved addresses; the Host header, SNI
+    and certificate verification still use the host name. Each address is
+    tried in turn. If none can be reached the resolver is forgotten, and the
+    connection falls back to normal DNS resolution unless an address timed
+    out, in which case the timeout is raised.
+    """
+
+    def __init__(self, *args, resolver: Optional[_WarmResolver] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._resolver = resolver
+
+    def _new_conn(self) -> socket.socket:
+        addresses = self._resolver.addresses() if self._resolver is not None else []
+        dns_host = self._dns_host
+        timed_out = None
+        try:
+            for address in addresses:
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except NewConnectionError:
+                    continue
+                except ConnectTimeoutError as e:
+                    timed_out = e
+        finally:
+            self._dns_host = dns_host
+        if addresses:
+            self._resolver.forget()
+        # A fresh lookup mostly returns the same addresses, so after a
+        # timeout it would only make the caller wait for the timeout again.
+        if timed_out is not None:
+            raise timed_out
+        return super()._new_conn()
+
+
 class EventCalendar:
     def __init__(
         self,
@@ -20,8 +241,15 @@ class EventCalendar:
         timeout: int = 10,
         retries: int = 3,
         backoff_factor: float = 0.5,
+        pool_maxsize: int = 32,
+        cache: bool = False,
+        cache_ttl: float = 3600,
+        cache_maxsize: int = 4096,
+        http2: bool = False,
+        arrow: bool = False,
     ):
-        self.base_url = "https://api.nasdaq.com/api"
+        self.api_host = "api.nasdaq.com"
+        self.base_url = f"https://{self.api_host}/api"
         self.earnings_url = f"{self.base_url}/calendar/earnings"
         self.dividends_url = f"{self.base_url}/calendar/dividends"
         self.ipo_url = f"{self.base_url}/ipo/calendar"
@@ -30,6 +258,7 @@ class EventCalendar:
 
         self.headers = headers or {
             "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36",
+            "Connection": "keep-alive",
         }
 
         self.timeout = timeout
@@ -38,12 +267,78 @@ class EventCalendar:
         retry = Retry(
             total=retries,
             backoff_factor=backoff_factor,
-            status_forcelist=[500, 502, 503, 504],
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+        )
+        self._retry = retry
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_connections=1,
+            pool_maxsize=pool_maxsize,
         )
-        adapter = HTTPAdapter(max_retries=retry)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
+        # Requests to the API host skip the requests and PoolManager layers
+        # and go straight to a single urllib3 pool, unless the session carries
+        # settings the pool does not know about (see _bypasses_session). The
+        # pool shares the session's headers, so later changes apply to both.
+        self._api_origin = f"https://{self.api_host}"
+        self._environ_overrides = bool(
+            requests.utils.get_environ_proxies(self.base_url)
+            or requests.utils.get_netrc_auth(self.base_url)
+            or os.environ.get("REQUESTS_CA_BUNDLE")
+            or os.environ.get("CURL_CA_BUNDLE")
+        )
+        self._resolver = _WarmResolver(self.api_host, 443)
+        self._pool = urllib3.HTTPSConnectionPool(
+            self.api_host,
+            maxsize=pool_maxsize,
+            block=False,
+            headers=self.session.headers,
+            retries=retry,
+            timeout=timeout,
+            ca_certs=requests.certs.where(),
+            resolver=self._resolver,
+        )
+        self._pool.ConnectionCls = _WarmHTTPSConnection
+
+        # Resolve the API host in the background so the first request does
+        # not pay for the DNS lookup.
+        threading.Thread(target=self._resolver.resolve, daemon=True).start()
+
+        # With http2=True, API requests are multiplexed over a single
+        # HTTP/2 connection by httpx instead of the urllib3 pool.
+        self._client = None
+        if http2:
+            if httpx is None:
+                raise ImportError(
+                    "http2=True requires httpx: pip install 'event-calendar[http2]'"
+                )
+            self._client = httpx.Client(
+                timeout=timeout,
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    retries=retries,
+                    limits=httpx.Limits(max_connections=pool_maxsize),
+                ),
+            )
+
+        if arrow and pa is None:
+            raise ImportError(
+                "arrow=True requires pyarrow: pip install 'event-calendar[arrow]'"
+            )
+        self.arrow = arrow
+
+        self.cache_ttl = cache_ttl
+        self.cache_maxsize = cache_maxsize
+        self._cache: Optional[OrderedDict[Tuple, Tuple[float, Dict]]] = (
+            OrderedDict() if cache else None
+        )
+        self._cache_lock = threading.Lock()
+        self._local = threading.local()
+
     def _fetch(
         self, url: str, params: Optional[Dict[str, Union[str, int]]] = None
     ) -> Dict:
@@ -60,15 +355,355 @@ class EventCalendar:
         Returns:
             Dict: Response data in JSON format.
         """
+        key = (url, tuple(sorted((params or {}).items())))
+        if self._cache is not None:
+            with self._cache_lock:
+                entry = self._cache.get(key)
+                if entry is not None:
+                    if time.monotonic() < entry[0]:
+                        self._cache.move_to_end(key)
+                        return entry[1]
+                    del self._cache[key]
+
+        bucket = getattr(self._local, "bucket", None)
+        if bucket is not None:
+            bucket.acquire()
+
         try:
-            response = self.session.get(url, params=params, timeout=self.timeout)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            direct = self._bypasses_session(url)
+            if direct and self._client is not None:
+                response = self._client_get(url, params=params)
+                response.raise_for_status()
+                content = response.content
+            elif direct:
+                target = url[len(self._api_origin) :]
+                if params:
+                    target = f"{target}?{urlencode(params)}"
+                response = self._pool.urlopen("GET", target, timeout=self.timeout)
+                if response.status >= 400:
+                    raise EventCalendarError(
+                        f"Error fetching data from {url}: HTTP {response.status}"
+                    )
+                content = response.data
+            else:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+                response.raise_for_status()
+                content = response.content
+            # Every transport hands over the raw body bytes, which are decoded
+            # without building an intermediate str. The body is not streamed
+            # into pyarrow.json: it reads newline-delimited records, while the
+            # API returns a single envelope whose status, asOf and rows are
+            # needed here as Python objects (and for the cache) anyway.
+            data = orjson.loads(content) if orjson else json.loads(content)
+        except _FETCH_ERRORS as e:
             raise EventCalendarError(f"Error fetching data from {url}: {str(e)}")
         except ValueError:
             raise EventCalendarError(f"Error decoding JSON response from {url}")
 
+        if self._cache is not None and self._cacheable(data):
+            expires = self._cache_expiry(params)
+            with self._cache_lock:
+                self._cache[key] = (expires, data)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_maxsize:
+                    self._cache.popitem(last=False)
+        return data
+
+    def _bypasses_session(self, url: str) -> bool:
+        """Internal method to check whether a request can skip the session.
+
+        The direct urllib3 pool and httpx client only cover the API host and
+        know nothing about proxies, custom CA bundles, client certificates,
+        cookies or .netrc credentials, so the session is used whenever any of
+        those is configured on it or, with ``trust_env``, in the environment.
+
+        Args:
+            url (str): URL to fetch data from.
+
+        Returns:
+            bool: True if the request can go through the direct transport.
+        """
+        session = self.session
+        return (
+            url.startswith(self._api_origin)
+            and not (session.trust_env and self._environ_overrides)
+            and not session.proxies
+            and session.verify is True
+            and session.cert is None
+            and not session.auth
+            and not session.cookies
+        )
+
+    def _client_get(
+        self, url: str, params: Optional[Dict[str, Union[str, int]]] = None
+    ) -> "httpx.Response":
+        """Internal method to GET with the httpx client, retrying like the session.
+
+        httpx only retries failed connections, so responses are retried here
+        with the same ``Retry`` policy the session and urllib3 pool use: the
+        same status codes and retry budget, waiting for Retry-After when the
+        server sends it and for the exponential backoff otherwise.
+
+        Args:
+            url (str): URL to fetch data from.
+            params (Optional[Dict[str, Union[str, int]]], optional): Query parameters to include in the request. Defaults to None.
+
+        Returns:
+            httpx.Response: Last response received.
+        """
+        retry = self._retry
+        while True:
+            response = self._client.get(
+                url, params=params, headers=self.session.headers, timeout=self.timeout
+            )
+            retry_after = response.headers.get("Retry-After")
+            if not retry.is_retry("GET", response.status_code, retry_after is not None):
+                return response
+            try:
+                retry = retry.increment("GET", url)
+            except urllib3.exceptions.MaxRetryError:
+                return response
+            if retry.respect_retry_after_header and retry_after is not None:
+                time.sleep(retry.parse_retry_after(retry_after))
+            else:
+                time.sleep(retry.get_backoff_time())
+
+    def _cacheable(self, data: Dict) -> bool:
+        """Internal method to check whether a response may be cached.
+
+        Args:
+            data (Dict): Response data.
+
+        Returns:
+            bool: True if the response carries no error status.
+        """
+        status = data.get("status") or {}
+        return status.get("bCodeMessage") is None
+
+    def _cache_expiry(
+        self, params: Optional[Dict[str, Union[str, int]]] = None
+    ) -> float:
+        """Internal method to compute when a cached response expires.
+
+        Data for past dates never changes, so it does not expire. Anything
+        else, including the current date and requests without a date, is
+        kept for ``cache_ttl`` seconds. "Past" is judged against the current
+        date in US Eastern time, where Nasdaq's trading day is defined.
+
+        Args:
+            params (Optional[Dict[str, Union[str, int]]], optional): Query parameters of the request. Defaults to None.
+
+        Returns:
+            float: Expiry time on the ``time.monotonic`` clock.
+        """
+        date = (params or {}).get("date")
+        today = datetime.now(_market_tz()).strftime("%Y-%m-%d")
+        if isinstance(date, str) and date < today[: len(date)]:
+            return math.inf
+        return time.monotonic() + self.cache_ttl
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses."""
+        if self._cache is not None:
+            with self._cache_lock:
+                self._cache.clear()
+
+    def _paced(
+        self, func: Callable[[str], pd.DataFrame], sleep: Union[float | int]
+    ) -> Callable[[str], pd.DataFrame]:
+        """Internal method to rate limit the requests a getter makes.
+
+        The returned callable shares one token bucket across all threads
+        that run it. The bucket is handed to ``_fetch`` through a
+        thread-local so that only cache misses wait for a token.
+
+        Args:
+            func (Callable[[str], pd.DataFrame]): Getter to wrap.
+            sleep (float | int): Minimum interval between request starts, 0 disables pacing.
+
+        Returns:
+            Callable[[str], pd.DataFrame]: Getter that paces its requests.
+        """
+        bucket = TokenBucket(1 / sleep) if sleep > 0 else None
+
+        def run(date: str) -> pd.DataFrame:
+            self._local.bucket = bucket
+            try:
+                return func(date)
+            finally:
+                self._local.bucket = None
+
+        return run
+
+    def _iter_range(
+        self,
+        func: Callable[[str], pd.DataFrame],
+        dates: List[str],
+        sleep: Union[float | int],
+        max_workers: int,
+        name: str,
+    ) -> Generator[pd.DataFrame, None, None]:
+        """Internal method to fetch a range of dates with a thread pool.
+
+        Args:
+            func (Callable[[str], pd.DataFrame]): Getter to call for each date.
+            dates (List[str]): Dates to fetch.
+            sleep (float | int): Minimum interval between request starts, 0 disables pacing.
+            max_workers (int): Maximum number of concurrent requests.
+            name (str): Data name used in error messages.
+
+        Yields:
+            Generator[pd.DataFrame, None, None]: DataFrame for each date, in input order.
+        """
+        run = self._paced(func, sleep)
+
+        # Only keep a bounded window of dates in flight so a slow consumer
+        # does not end up holding every finished DataFrame in memory.
+        window = 2 * max_workers
+        remaining = iter(dates)
+        pending = deque()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+            def submit() -> None:
+                for date in itertools.islice(remaining, window - len(pending)):
+                    pending.append((date, executor.submit(run, date)))
+
+            try:
+                submit()
+                while pending:
+                    date, future = pending.popleft()
+                    submit()
+                    try:
+                        yield future.result()
+                    except EventCalendarError as e:
+                        print(f"Error fetching {name} data for {date}: {e}")
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    async def _agather(
+        self,
+        func: Callable[[str], pd.DataFrame],
+        dates: Iterable[str],
+        max_workers: int,
+    ) -> List[Union[pd.DataFrame, BaseException]]:
+        """Internal method to run a blocking getter concurrently over dates.
+
+        Each call runs on a dedicated thread pool sized to ``max_workers``,
+        rather than the loop's default executor whose worker count would
+        otherwise cap it. The calls share this instance's transport: the
+        direct urllib3 pool, the httpx client with ``http2=True``, or the
+        session when ``_bypasses_session`` rules the direct path out.
+
+        Args:
+            func (Callable[[str], pd.DataFrame]): Getter to call for each date.
+            dates (Iterable[str]): Dates to pass to the getter.
+            max_workers (int): Maximum number of concurrent requests.
+
+        Returns:
+            List[Union[pd.DataFrame, BaseException]]: Result or exception for each date, in input order.
+        """
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            return await asyncio.gather(
+                *(loop.run_in_executor(executor, func, date) for date in dates),
+                return_exceptions=True,
+            )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _aiter_range(
+        self,
+        func: Callable[[str], pd.DataFrame],
+        dates: List[str],
+        sleep: Union[float | int],
+        max_workers: int,
+        name: str,
+    ) -> AsyncGenerator[pd.DataFrame, None]:
+        """Internal method to fetch a range of dates concurrently.
+
+        Dates run on a dedicated thread pool and are yielded in input order,
+        each as soon as it and every earlier date have finished.
+
+        Args:
+            func (Callable[[str], pd.DataFrame]): Getter to call for each date.
+            dates (List[str]): Dates to fetch.
+            sleep (float | int): Minimum interval between request starts, 0 disables pacing.
+            max_workers (int): Maximum number of concurrent requests.
+            name (str): Data name used in error messages.
+
+        Yields:
+            AsyncGenerator[pd.DataFrame, None]: DataFrame for each date, in input order.
+        """
+        run = self._paced(func, sleep)
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        # Like _iter_range, only keep a bounded window of dates in flight so
+        # the first DataFrame is yielded as soon as it arrives and a slow
+        # consumer does not end up holding every finished DataFrame.
+        window = 2 * max_workers
+        remaining = iter(dates)
+        pending = deque()
+
+        def submit() -> None:
+            for date in itertools.islice(remaining, window - len(pending)):
+                pending.append((date, loop.run_in_executor(executor, run, date)))
+
+        try:
+            submit()
+            while pending:
+                date, future = pending.popleft()
+                submit()
+                try:
+                    yield await future
+                except EventCalendarError as e:
+                    print(f"Error fetching {name} data for {date}: {e}")
+        finally:
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _aconcat_range(
+        self,
+        func: Callable[[str], pd.DataFrame],
+        dates: List[str],
+        sleep: Union[float | int],
+        max_workers: int,
+        name: str,
+    ) -> pd.DataFrame:
+        """Internal method to fetch a range of dates concurrently into one DataFrame.
+
+        Args:
+            func (Callable[[str], pd.DataFrame]): Getter to call for each date.
+            dates (List[str]): Dates to fetch.
+            sleep (float | int): Minimum interval between request starts, 0 disables pacing.
+            max_workers (int): Maximum number of concurrent requests.
+            name (str): Data name used in error messages.
+
+        Raises:
+            EventCalendarError: No data found for any date in the range.
+
+        Returns:
+            pd.DataFrame: DataFrames for all dates concatenated in input order.
+        """
+        # Every DataFrame is needed before concatenating, so all dates are
+        # submitted at once rather than through _aiter_range's window.
+        results = await self._agather(self._paced(func, sleep), dates, max_workers)
+        frames = []
+        for date, result in zip(dates, results):
+            if isinstance(result, EventCalendarError):
+                print(f"Error fetching {name} data for {date}: {result}")
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                frames.append(result)
+        if not frames:
+            raise EventCalendarError(f"No {name} data found.")
+        return pd.concat(frames, ignore_index=True)
+
     def _status_verify(self, response: Dict) -> Dict:
         """Internal method to verify the status of the response.
 
@@ -88,6 +723,77 @@ class EventCalendar:
 
         return response
 
+    def _to_frame(
+        self,
+        rows: List[Dict],
+        numeric_columns: Tuple[str, ...] = (),
+        date: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Internal method to build a DataFrame from response rows.
+
+        Rows are transposed into columns before calling the constructor,
+        which avoids pandas' list-of-dicts path, and the date column is
+        built up front rather than inserted afterwards. Rows with differing
+        fields fall back to the list-of-dicts path so no column is dropped.
+        With ``arrow=True`` the rows go through a pyarrow Table instead and
+        ``numeric_columns`` are parsed to float64.
+
+        Args:
+            rows (List[Dict]): Rows from the response data.
+            numeric_columns (Tuple[str, ...], optional): Text columns to parse as numbers with arrow=True. Defaults to ().
+            date (Optional[str], optional): Date to add as the first column. Defaults to None.
+
+        Returns:
+            pd.DataFrame: DataFrame with one row per response row.
+        """
+        if not rows:
+            return pd.DataFrame()
+        columns = rows[0].keys()
+        if not self.arrow and all(row.keys() == columns for row in rows):
+            data = {}
+            if date is not None:
+                data["date"] = pd.DatetimeIndex([_parse_date(date)]).repeat(len(rows))
+            for column in columns:
+                data[column] = [row.get(column) for row in rows]
+            return pd.DataFrame(data, copy=False)
+
+        if self.arrow:
+            df = self._to_arrow_frame(rows, numeric_columns)
+        else:
+            df = pd.DataFrame(rows)
+        if date is not None:
+            df.insert(0, "date", _parse_date(date))
+        return df
+
+    def _to_arrow_frame(
+        self, rows: List[Dict], numeric_columns: Tuple[str, ...]
+    ) -> pd.DataFrame:
+        """Internal method to build an Arrow-backed DataFrame from response rows.
+
+        Args:
+            rows (List[Dict]): Rows from the response data.
+            numeric_columns (Tuple[str, ...]): Text columns to parse as numbers.
+
+        Returns:
+            pd.DataFrame: DataFrame with ``pd.ArrowDtype`` columns.
+        """
+        # from_pylist infers the schema from the first row only, so collect
+        # the fields of every row to keep columns that appear later.
+        columns = dict.fromkeys(field for row in rows for field in row)
+        table = pa.Table.from_pydict(
+            {column: [row.get(column) for row in rows] for column in columns}
+        )
+        for name in numeric_columns:
+            index = table.schema.get_field_index(name)
+            if index == -1 or not pa.types.is_string(table.schema.field(index).type):
+                continue
+            column = pc.replace_substring_regex(table.column(index), r"[$,\s]", "")
+            column = pc.replace_substring_regex(column, r"^\((.*)\)$", r"-\1")
+            valid = pc.match_substring_regex(column, r"^-?\d+(\.\d+)?$")
+            column = pc.if_else(valid, column, pa.scalar(None, pa.string()))
+            table = table.set_column(index, name, pc.cast(column, pa.float64()))
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
     def get_earnings(
         self,
         date: str,
@@ -108,13 +814,13 @@ class EventCalendar:
         params = {"date": date}
         response = self._fetch(self.earnings_url, params=params)
         response = self._status_verify(response)
-        earnings_date = response.get("data", {})["asOf"]
-        earnings_data = response.get("data", {}).get("rows", [])
+        data = response.get("data") or {}
+        earnings_date = data["asOf"]
+        earnings_data = data.get("rows", [])
 
-        df = pd.DataFrame(earnings_data)
+        df = self._to_frame(earnings_data, _EARNINGS_NUMERIC_COLUMNS, earnings_date)
         if df.empty:
             raise EventCalendarError("No earnings data found.")
-        df.insert(0, "date", pd.to_datetime(earnings_date))
 
         return df
 
@@ -123,6 +829,7 @@ class EventCalendar:
         start_date: str,
         end_date: str,
         sleep: Union[float | int] = 0.1,
+        max_workers: int = 8,
     ) -> Generator[pd.DataFrame, None, None]:
         """Get earnings data for a range of dates.
 
@@ -133,7 +840,8 @@ class EventCalendar:
         Args:
             start_date (str): Accept date in YYYY-MM-DD format.
             end_date (str): Accept date in YYYY-MM-DD format.
-            sleep (float | int): Sleep time between requests. Defaults to 0.1.
+            sleep (float | int): Minimum interval between request starts. Defaults to 0.1.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 8.
 
         Raises:
             EventCalendarError: Error fetching earnings data.
@@ -142,16 +850,67 @@ class EventCalendar:
             Generator[pd.DataFrame, None, None]: DataFrame containing earnings data for each date in the range.
         """
 
-        business_date_range = pd.bdate_range(start_date, end_date)
+        dates = _business_days(start_date, end_date)
+        yield from self._iter_range(
+            self.get_earnings, dates, sleep, max_workers, "earnings"
+        )
 
-        for date in business_date_range:
-            date = date.strftime("%Y-%m-%d")
-            try:
-                earnings_data = self.get_earnings(date)
-                yield earnings_data
-            except EventCalendarError as e:
-                print(f"Error fetching earnings data for {date}: {e}")
-            time.sleep(sleep)
+    async def aget_earnings_range(
+        self,
+        start_date: str,
+        end_date: str,
+        sleep: Union[float | int] = 0.1,
+        max_workers: int = 8,
+    ) -> AsyncGenerator[pd.DataFrame, None]:
+        """Get earnings data for a range of dates concurrently.
+
+        Example:
+            >>> async for df in ec.aget_earnings_range("2025-04-11", "2025-04-17"):
+            ...     print(df)
+
+        Args:
+            start_date (str): Accept date in YYYY-MM-DD format.
+            end_date (str): Accept date in YYYY-MM-DD format.
+            sleep (float | int, optional): Minimum interval between request starts. Defaults to 0.1.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 8.
+
+        Yields:
+            AsyncGenerator[pd.DataFrame, None]: DataFrame containing earnings data for each date in the range.
+        """
+        dates = _business_days(start_date, end_date)
+        async for df in self._aiter_range(
+            self.get_earnings, dates, sleep, max_workers, "earnings"
+        ):
+            yield df
+
+    async def aget_earnings_all(
+        self,
+        start_date: str,
+        end_date: str,
+        sleep: Union[float | int] = 0.1,
+        max_workers: int = 16,
+    ) -> pd.DataFrame:
+        """Get earnings data for a range of dates concurrently as one DataFrame.
+
+        Example:
+            >>> df = await ec.aget_earnings_all("2024-01-01", "2024-12-31")
+
+        Args:
+            start_date (str): Accept date in YYYY-MM-DD format.
+            end_date (str): Accept date in YYYY-MM-DD format.
+            sleep (float | int, optional): Minimum interval between request starts. Defaults to 0.1.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 16.
+
+        Raises:
+            EventCalendarError: No earnings data found in the range.
+
+        Returns:
+            pd.DataFrame: DataFrame containing earnings data for every date in the range.
+        """
+        dates = _business_days(start_date, end_date)
+        return await self._aconcat_range(
+            self.get_earnings, dates, sleep, max_workers, "earnings"
+        )
 
     def get_dividends(self, date: str) -> pd.DataFrame:
         """Get dividends data for a specific date.
@@ -170,13 +929,13 @@ class EventCalendar:
         params = {"date": date}
         response = self._fetch(self.dividends_url, params=params)
         response = self._status_verify(response)
-        dividends_date = response.get("data", {}).get("calendar", {})["asOf"]
-        dividends_data = response.get("data", {}).get("calendar", {}).get("rows", [])
+        calendar = (response.get("data") or {}).get("calendar") or {}
+        dividends_date = calendar["asOf"]
+        dividends_data = calendar.get("rows", [])
 
-        df = pd.DataFrame(dividends_data)
+        df = self._to_frame(dividends_data, _DIVIDENDS_NUMERIC_COLUMNS, dividends_date)
         if df.empty:
             raise EventCalendarError("No dividends data found.")
-        df.insert(0, "date", pd.to_datetime(dividends_date))
 
         return df
 
@@ -185,6 +944,7 @@ class EventCalendar:
         start_date: str,
         end_date: str,
         sleep: Union[float | int] = 0.1,
+        max_workers: int = 8,
     ) -> Generator[pd.DataFrame, None, None]:
         """Get dividends data for a range of dates.
 
@@ -195,7 +955,8 @@ class EventCalendar:
         Args:
             start_date (str): Accept date in YYYY-MM-DD format.
             end_date (str): Accept date in YYYY-MM-DD format.
-            sleep (float | int): Sleep time between requests. Defaults to 0.1.
+            sleep (float | int): Minimum interval between request starts. Defaults to 0.1.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 8.
 
         Raises:
             EventCalendarError: Error fetching dividends data.
@@ -204,16 +965,67 @@ class EventCalendar:
             Generator[pd.DataFrame, None, None]: DataFrame containing dividends data for each date in the range.
         """
 
-        business_date_range = pd.bdate_range(start_date, end_date)
+        dates = _business_days(start_date, end_date)
+        yield from self._iter_range(
+            self.get_dividends, dates, sleep, max_workers, "dividends"
+        )
 
-        for date in business_date_range:
-            date = date.strftime("%Y-%m-%d")
-            try:
-                dividends_data = self.get_dividends(date)
-                yield dividends_data
-            except EventCalendarError as e:
-                print(f"Error fetching dividends data for {date}: {e}")
-            time.sleep(sleep)
+    async def aget_dividends_range(
+        self,
+        start_date: str,
+        end_date: str,
+        sleep: Union[float | int] = 0.1,
+        max_workers: int = 8,
+    ) -> AsyncGenerator[pd.DataFrame, None]:
+        """Get dividends data for a range of dates concurrently.
+
+        Example:
+            >>> async for df in ec.aget_dividends_range("2025-04-11", "2025-04-17"):
+            ...     print(df)
+
+        Args:
+            start_date (str): Accept date in YYYY-MM-DD format.
+            end_date (str): Accept date in YYYY-MM-DD format.
+            sleep (float | int, optional): Minimum interval between request starts. Defaults to 0.1.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 8.
+
+        Yields:
+            AsyncGenerator[pd.DataFrame, None]: DataFrame containing dividends data for each date in the range.
+        """
+        dates = _business_days(start_date, end_date)
+        async for df in self._aiter_range(
+            self.get_dividends, dates, sleep, max_workers, "dividends"
+        ):
+            yield df
+
+    async def aget_dividends_all(
+        self,
+        start_date: str,
+        end_date: str,
+        sleep: Union[float | int] = 0.1,
+        max_workers: int = 16,
+    ) -> pd.DataFrame:
+        """Get dividends data for a range of dates concurrently as one DataFrame.
+
+        Example:
+            >>> df = await ec.aget_dividends_all("2024-01-01", "2024-12-31")
+
+        Args:
+            start_date (str): Accept date in YYYY-MM-DD format.
+            end_date (str): Accept date in YYYY-MM-DD format.
+            sleep (float | int, optional): Minimum interval between request starts. Defaults to 0.1.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 16.
+
+        Raises:
+            EventCalendarError: No dividends data found in the range.
+
+        Returns:
+            pd.DataFrame: DataFrame containing dividends data for every date in the range.
+        """
+        dates = _business_days(start_date, end_date)
+        return await self._aconcat_range(
+            self.get_dividends, dates, sleep, max_workers, "dividends"
+        )
 
     def get_ipo(self, date: str) -> pd.DataFrame:
         """Get IPO data for a specific date.
@@ -234,9 +1046,10 @@ class EventCalendar:
         response = self._fetch(self.ipo_url, params=params)
         response = self._status_verify(response)
         # ipo_date = response.get("data", {}).get("priced", {}).get("asOf") or date
-        ipo_data = response.get("data", {}).get("priced", {}).get("rows", [])
+        priced = (response.get("data") or {}).get("priced") or {}
+        ipo_data = priced.get("rows", [])
 
-        df = pd.DataFrame(ipo_data)
+        df = self._to_frame(ipo_data)
         if df.empty:
             raise EventCalendarError("No IPO data found.")
         # year_month = ipo_date[:7]
@@ -248,7 +1061,8 @@ class EventCalendar:
         self,
         start_date: str,
         end_date: str,
-        sleep: Union[float | int] = 0.1,
+        sleep: Union[float | int] = 0,
+        max_workers: Optional[int] = None,
     ) -> Generator[pd.DataFrame, None, None]:
         """Get IPO data for a range of dates.
 
@@ -259,7 +1073,8 @@ class EventCalendar:
         Args:
             start_date (str): Accept date in YYYY-MM format.
             end_date (str): Accept date in YYYY-MM format.
-            sleep (float | int, optional): Sleep time between requests. Defaults to 0.1.
+            sleep (float | int, optional): Minimum interval between request starts. Defaults to 0, since monthly calls are sparse.
+            max_workers (Optional[int], optional): Maximum number of concurrent requests. Defaults to one per month, up to 12.
 
         Raises:
             EventCalendarError: Error fetching IPO data.
@@ -267,19 +1082,65 @@ class EventCalendar:
         Yields:
             Generator[pd.DataFrame, None, None]: DataFrame containing IPO data for each month in the range.
         """
-        start_date = datetime.strptime(start_date, "%Y-%m")
-        end_date = datetime.strptime(end_date, "%Y-%m")
+        dates = _months(start_date, end_date)
+        if max_workers is None:
+            max_workers = max(1, min(12, len(dates)))
+        yield from self._iter_range(self.get_ipo, dates, sleep, max_workers, "IPO")
 
-        month_range = pd.date_range(start=start_date, end=end_date, freq="MS")
+    async def aget_ipo_range(
+        self,
+        start_date: str,
+        end_date: str,
+        sleep: Union[float | int] = 0,
+        max_workers: int = 8,
+    ) -> AsyncGenerator[pd.DataFrame, None]:
+        """Get IPO data for a range of months concurrently.
 
-        for date in month_range:
-            date = date.strftime("%Y-%m")
-            try:
-                ipo_data = self.get_ipo(date)
-                yield ipo_data
-            except EventCalendarError as e:
-                print(f"Error fetching IPO data for {date}: {e}")
-            time.sleep(sleep)
+        Example:
+            >>> async for df in ec.aget_ipo_range("2025-04", "2025-06"):
+            ...     print(df)
+
+        Args:
+            start_date (str): Accept date in YYYY-MM format.
+            end_date (str): Accept date in YYYY-MM format.
+            sleep (float | int, optional): Minimum interval between request starts. Defaults to 0, since monthly calls are sparse.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 8.
+
+        Yields:
+            AsyncGenerator[pd.DataFrame, None]: DataFrame containing IPO data for each month in the range.
+        """
+        dates = _months(start_date, end_date)
+        async for df in self._aiter_range(
+            self.get_ipo, dates, sleep, max_workers, "IPO"
+        ):
+            yield df
+
+    async def aget_ipo_all(
+        self,
+        start_date: str,
+        end_date: str,
+        sleep: Union[float | int] = 0,
+        max_workers: int = 16,
+    ) -> pd.DataFrame:
+        """Get IPO data for a range of months concurrently as one DataFrame.
+
+        Example:
+            >>> df = await ec.aget_ipo_all("2024-01", "2024-12")
+
+        Args:
+            start_date (str): Accept date in YYYY-MM format.
+            end_date (str): Accept date in YYYY-MM format.
+            sleep (float | int, optional): Minimum interval between request starts. Defaults to 0, since monthly calls are sparse.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 16.
+
+        Raises:
+            EventCalendarError: No IPO data found in the range.
+
+        Returns:
+            pd.DataFrame: DataFrame containing IPO data for every month in the range.
+        """
+        dates = _months(start_date, end_date)
+        return await self._aconcat_range(self.get_ipo, dates, sleep, max_workers, "IPO")
 
     def get_economic_calendar(self, date: str) -> pd.DataFrame:
         """Get economic calendar data for a specific date.
@@ -300,11 +1161,10 @@ class EventCalendar:
         response = self._status_verify(response)
         # economic_calendat_date = response.get("data", {})["asOf"]
         economic_calendat_date = date
-        economic_calendat_data = response.get("data", {}).get("rows", [])
-        df = pd.DataFrame(economic_calendat_data)
+        economic_calendat_data = (response.get("data") or {}).get("rows", [])
+        df = self._to_frame(economic_calendat_data, date=economic_calendat_date)
         if df.empty:
             raise EventCalendarError("No economic events data found.")
-        df.insert(0, "date", pd.to_datetime(economic_calendat_date))
 
         return df
 
@@ -313,6 +1173,7 @@ class EventCalendar:
         start_date: str,
         end_date: str,
         sleep: Union[float | int] = 0.1,
+        max_workers: int = 8,
     ) -> Generator[pd.DataFrame, None, None]:
         """Get economic calendar data for a range of dates.
 
@@ -324,7 +1185,8 @@ class EventCalendar:
             start_date (str): Accept date in YYYY-MM-DD format.
             end_date (str): Accept date in YYYY-MM-DD format.
 
-            sleep (float | int, optional): Sleep time between requests. Defaults to 0.1.
+            sleep (float | int, optional): Minimum interval between request starts. Defaults to 0.1.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 8.
 
         Raises:
             EventCalendarError: Error fetching economic calendar data.
@@ -332,16 +1194,67 @@ class EventCalendar:
         Yields:
             Generator[pd.DataFrame, None, None]: _description_
         """
-        business_date_range = pd.bdate_range(start_date, end_date)
+        dates = _business_days(start_date, end_date)
+        yield from self._iter_range(
+            self.get_economic_calendar, dates, sleep, max_workers, "economic calendar"
+        )
 
-        for date in business_date_range:
-            date = date.strftime("%Y-%m-%d")
-            try:
-                economic_calendat_data = self.get_economic_calendar(date)
-                yield economic_calendat_data
-            except EventCalendarError as e:
-                print(f"Error fetching economic calendar data for {date}: {e}")
-            time.sleep(sleep)
+    async def aget_economic_calendar_range(
+        self,
+        start_date: str,
+        end_date: str,
+        sleep: Union[float | int] = 0.1,
+        max_workers: int = 8,
+    ) -> AsyncGenerator[pd.DataFrame, None]:
+        """Get economic calendar data for a range of dates concurrently.
+
+        Example:
+            >>> async for df in ec.aget_economic_calendar_range("2025-01-01", "2025-01-31"):
+            ...     print(df)
+
+        Args:
+            start_date (str): Accept date in YYYY-MM-DD format.
+            end_date (str): Accept date in YYYY-MM-DD format.
+            sleep (float | int, optional): Minimum interval between request starts. Defaults to 0.1.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 8.
+
+        Yields:
+            AsyncGenerator[pd.DataFrame, None]: DataFrame containing economic calendar data for each date in the range.
+        """
+        dates = _business_days(start_date, end_date)
+        async for df in self._aiter_range(
+            self.get_economic_calendar, dates, sleep, max_workers, "economic calendar"
+        ):
+            yield df
+
+    async def aget_economic_calendar_all(
+        self,
+        start_date: str,
+        end_date: str,
+        sleep: Union[float | int] = 0.1,
+        max_workers: int = 16,
+    ) -> pd.DataFrame:
+        """Get economic calendar data for a range of dates concurrently as one DataFrame.
+
+        Example:
+            >>> df = await ec.aget_economic_calendar_all("2024-01-01", "2024-12-31")
+
+        Args:
+            start_date (str): Accept date in YYYY-MM-DD format.
+            end_date (str): Accept date in YYYY-MM-DD format.
+            sleep (float | int, optional): Minimum interval between request starts. Defaults to 0.1.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 16.
+
+        Raises:
+            EventCalendarError: No economic calendar data found in the range.
+
+        Returns:
+            pd.DataFrame: DataFrame containing economic calendar data for every date in the range.
+        """
+        dates = _business_days(start_date, end_date)
+        return await self._aconcat_range(
+            self.get_economic_calendar, dates, sleep, max_workers, "economic calendar"
+        )
 
     def get_splits(self) -> pd.DataFrame:
         """Get splits data.
@@ -354,8 +1267,8 @@ class EventCalendar:
         """
         response = self._fetch(self.splits_url)
         response = self._status_verify(response)
-        splits_data = response.get("data", {}).get("rows", [])
-        df = pd.DataFrame(splits_data)
+        splits_data = (response.get("data") or {}).get("rows", [])
+        df = self._to_frame(splits_data)
         if df.empty:
             raise EventCalendarError("No splits data found.")
 
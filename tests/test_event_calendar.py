@@ -0,0 +1,195 @@
+import asyncio
+import json
+import math
+import threading
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from event_calendar import EventCalendar, EventCalendarError
+from event_calendar.event_calendar import TokenBucket, _market_tz
+
+
+def _earnings(date):
+    return {
+        "data": {"asOf": date, "rows": [{"symbol": "AAA"}, {"symbol": "BBB"}]},
+        "status": {"bCodeMessage": None},
+    }
+
+
+@pytest.fixture
+def ec(monkeypatch):
+    for name in (
+        "REQUESTS_CA_BUNDLE",
+        "CURL_CA_BUNDLE",
+        "HTTP_PROXY",
+        "HTTPS_PROXY",
+        "ALL_PROXY",
+        "http_proxy",
+        "https_proxy",
+        "all_proxy",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    calendar = EventCalendar(cache=True)
+    calendar._environ_overrides = False
+    calendar.calls = []
+
+    def urlopen(method, target, **kwargs):
+        calendar.calls.append(target)
+        date = target.rsplit("=", 1)[-1]
+        if date.endswith("-19"):
+            payload = {
+                "data": None,
+                "status": {"bCodeMessage": [{"errorMessage": "no data"}]},
+            }
+        else:
+            payload = _earnings(date)
+        return SimpleNamespace(status=200, data=json.dumps(payload).encode())
+
+    monkeypatch.setattr(calendar._pool, "urlopen", urlopen)
+    return calendar
+
+
+def test_get_earnings_uses_direct_pool(ec):
+    df = ec.get_earnings("2024-04-17")
+    assert ec.calls == ["/api/calendar/earnings?date=2024-04-17"]
+    assert list(df.columns) == ["date", "symbol"]
+    assert (df["date"] == datetime(2024, 4, 17)).all()
+
+
+def test_error_status_raises_and_is_not_cached(ec):
+    for _ in range(2):
+        with pytest.raises(EventCalendarError, match="no data"):
+            ec.get_earnings("2024-04-19")
+    assert len(ec.calls) == 2
+
+
+def test_cache_expiry_past_today_and_months(ec):
+    today = datetime.now(_market_tz())
+    assert ec._cache_expiry({"date": "2000-01-03"}) == math.inf
+    assert ec._cache_expiry({"date": "2000-01"}) == math.inf
+    assert ec._cache_expiry({"date": today.strftime("%Y-%m-%d")}) < math.inf
+    assert ec._cache_expiry({"date": today.strftime("%Y-%m")}) < math.inf
+    assert ec._cache_expiry({"date": "2999-01-01"}) < math.inf
+    assert ec._cache_expiry(None) < math.inf
+
+
+def test_cache_evicts_least_recently_used(ec):
+    ec.cache_maxsize = 2
+    ec.get_earnings("2024-04-15")
+    ec.get_earnings("2024-04-16")
+    ec.get_earnings("2024-04-15")
+    ec.get_earnings("2024-04-17")
+    assert len(ec.calls) == 3
+
+    ec.get_earnings("2024-04-15")
+    assert len(ec.calls) == 3
+    ec.get_earnings("2024-04-16")
+    assert len(ec.calls) == 4
+
+
+def test_cache_disabled_by_default():
+    assert EventCalendar()._cache is None
+
+
+def test_to_frame_keeps_fields_missing_from_first_row(ec):
+    rows = [{"a": 1}, {"a": 2, "b": 3}]
+    df = ec._to_frame(rows, date="2024-04-17")
+    assert list(df.columns) == ["date", "a", "b"]
+    assert df["b"].isna().tolist() == [True, False]
+
+
+def test_to_frame_same_fields_in_different_order(ec):
+    rows = [{"a": 1, "b": 2}, {"b": 4, "a": 3}]
+    df = ec._to_frame(rows)
+    assert df.to_dict("records") == [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
+
+
+def test_bypasses_session(ec):
+    assert ec._bypasses_session(ec.earnings_url)
+    assert not ec._bypasses_session("https://example.com/api")
+
+    ec._environ_overrides = True
+    assert not ec._bypasses_session(ec.earnings_url)
+    ec.session.trust_env = False
+    assert ec._bypasses_session(ec.earnings_url)
+
+
+@pytest.mark.parametrize(
+    "setting, value",
+    [
+        ("proxies", {"https": "http://proxy:8080"}),
+        ("verify", "/etc/ssl/ca.pem"),
+        ("cert", "/etc/ssl/client.pem"),
+        ("auth", ("user", "pass")),
+    ],
+)
+def test_session_settings_disable_bypass(ec, setting, value):
+    setattr(ec.session, setting, value)
+    assert not ec._bypasses_session(ec.earnings_url)
+
+
+def test_session_cookies_disable_bypass(ec):
+    ec.session.cookies.set("session", "1")
+    assert not ec._bypasses_session(ec.earnings_url)
+
+
+def test_token_bucket_paces_acquires():
+    bucket = TokenBucket(rate=20)
+    start = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+    assert time.monotonic() - start >= 0.19
+
+
+def test_range_paces_only_cache_misses(ec):
+    dates = ["2024-04-15", "2024-04-16", "2024-04-17"]
+    for date in dates:
+        ec.get_earnings(date)
+
+    start = time.monotonic()
+    frames = list(ec.get_earnings_range(dates[0], dates[-1], sleep=1))
+    assert len(frames) == 3
+    assert time.monotonic() - start < 0.5
+
+
+def test_range_skips_failed_dates(ec, capsys):
+    frames = list(ec.get_earnings_range("2024-04-18", "2024-04-22", sleep=0))
+    assert [df["date"].iloc[0].day for df in frames] == [18, 22]
+    assert "2024-04-19" in capsys.readouterr().out
+
+
+def test_iter_range_close_stops_submitting(ec):
+    started = []
+    lock = threading.Lock()
+
+    def func(date):
+        with lock:
+            started.append(date)
+        time.sleep(0.01)
+        return date
+
+    dates = [str(i) for i in range(100)]
+    gen = ec._iter_range(func, dates, 0, 2, "test")
+    assert next(gen) == "0"
+    gen.close()
+    time.sleep(0.1)
+    assert len(started) <= 2 * 2 + 1
+
+
+def test_async_range_matches_sync_order(ec):
+    async def collect():
+        return [
+            df async for df in ec.aget_earnings_range("2024-04-15", "2024-04-26", 0, 4)
+        ]
+
+    frames = asyncio.run(collect())
+    days = [df["date"].iloc[0].day for df in frames]
+    assert days == [15, 16, 17, 18, 22, 23, 24, 25, 26]
+
+
+def test_async_all_concatenates(ec):
+    df = asyncio.run(ec.aget_earnings_all("2024-04-15", "2024-04-17", sleep=0))
+    assert len(df) == 6